@@ -13,7 +13,7 @@ import gspread
 from google.oauth2.service_account import Credentials
 from company_config import OPENAI_API_KEY, get_gcp_service_account
 from context_manager import (
-    ContextManager,
+    get_context_manager,
     get_workspace_key,
     render_context_selector,
     render_context_editor,
@@ -798,7 +798,7 @@ workspace_key = get_workspace_key()
 # ------------------------------------------------------------
 with st.sidebar:
     st.header("🔐 Workspace & Context")
-    cm = ContextManager()
+    cm = get_context_manager()
     selected_context_name = render_context_selector(cm)
     current_context = None
     if selected_context_name:
@@ -1,113 +1,613 @@
+import functools
 import json
 import os
+import sys
 import hashlib
 from datetime import datetime
 from typing import Dict, List, Optional
 
-import streamlit as st
 import copy
 try:
-    from info import preferred_grant_criteria as DEFAULT_PREFERRED_CRITERIA
-except Exception:
-    # Generic defaults if info.py is absent
-    DEFAULT_PREFERRED_CRITERIA = {
-        "strong_yes": [
-            "SBIR", "STTR", "early-stage", "Phase I", "Phase II",
-            "emerging technology", "small business innovation",
-            "commercialization pathway", "technology de-risking",
-            "startup-friendly", "NSF", "pilot project", "dual-use",
+    import xxhash
+except ImportError:
+    # Fall back to sha256 if xxhash isn't installed
+    xxhash = None
+try:
+    import orjson
+except ImportError:
+    # Fall back to stdlib json if orjson isn't installed
+    orjson = None
+
+if orjson is not None:
+    def _loads(data) -> Dict:
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dumps_compact(obj) -> bytes:
+        return orjson.dumps(obj)
+else:
+    def _loads(data) -> Dict:
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+    def _dumps_compact(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Generic defaults if info.py is absent
+_GENERIC_DEFAULT_CRITERIA = {
+    "strong_yes": [
+        "SBIR", "STTR", "early-stage", "Phase I", "Phase II",
+        "emerging technology", "small business innovation",
+        "commercialization pathway", "technology de-risking",
+        "startup-friendly", "NSF", "pilot project", "dual-use",
+    ],
+    "conditional_yes": {
+        "technical_systems": [
+            "resilient systems", "zero-trust", "autonomous", "decision-making",
+            "secure data workflows", "operational AI",
         ],
-        "conditional_yes": {
-            "technical_systems": [
-                "resilient systems", "zero-trust", "autonomous", "decision-making",
-                "secure data workflows", "operational AI",
-            ],
-            "sociotech_modeling": [
-                "human decision-making", "data-informed decisions", "mission planning",
-                "workflow augmentation", "data visualization",
-            ],
-        },
-        "strong_no": [
-            "urban planning", "transportation modeling", "community behavior analytics",
-            "infrastructure investment", "socioeconomic planning",
+        "sociotech_modeling": [
+            "human decision-making", "data-informed decisions", "mission planning",
+            "workflow augmentation", "data visualization",
         ],
+    },
+    "strong_no": [
+        "urban planning", "transportation modeling", "community behavior analytics",
+        "infrastructure investment", "socioeconomic planning",
+    ],
+}
+
+_DEFAULT_CRITERIA_JSON: Optional[bytes] = None
+
+
+def _default_criteria_json() -> bytes:
+    """Resolve info.py lazily and serialize the defaults once, on first use.
+
+    Round-tripping this snapshot through the JSON codec is a cheaper way to
+    clone the nested defaults than copy.deepcopy.
+    """
+    global _DEFAULT_CRITERIA_JSON
+    if _DEFAULT_CRITERIA_JSON is None:
+        try:
+            from info import preferred_grant_criteria as defaults
+        except Exception:
+            defaults = _GENERIC_DEFAULT_CRITERIA
+        _DEFAULT_CRITERIA_JSON = _dumps_compact(defaults)
+    return _DEFAULT_CRITERIA_JSON
+
+
+def default_preferred_criteria() -> Dict:
+    """Return a fresh, mutable copy of the default grant criteria."""
+    return _loads(_default_criteria_json())
+
+
+# Most saved contexts keep the bulk of the default keyword lists, so on disk
+# the criteria are stored as a delta against the defaults ({added, removed}
+# per bucket) and reconstructed on load. Keywords are run through sys.intern
+# so the many near-identical contexts in a workspace share string objects.
+_CRITERIA_DELTA_FORMAT = "delta-v1"
+
+
+def _intern_list(keywords) -> List[str]:
+    return [sys.intern(kw) if isinstance(kw, str) else kw for kw in keywords]
+
+
+def _diff_keywords(current: List[str], default: List[str]) -> Dict[str, List[str]]:
+    default_set = set(default)
+    current_set = set(current)
+    return {
+        "added": [kw for kw in current if kw not in default_set],
+        "removed": [kw for kw in default if kw not in current_set],
     }
 
 
+def _apply_keywords(delta: Dict, default: List[str]) -> List[str]:
+    removed = set(delta.get("removed", []))
+    kept = [kw for kw in default if kw not in removed]
+    return _intern_list(kept + list(delta.get("added", [])))
+
+
+def _is_criteria_full(criteria: Dict) -> bool:
+    """True when every bucket is the list shape the editor produces — the
+    write-side mirror of _is_criteria_delta. Anything else (e.g. a string,
+    which would diff per character) must be stored verbatim, not diffed."""
+    if not all(isinstance(criteria.get(bucket), list) for bucket in ("strong_yes", "strong_no")):
+        return False
+    conditional = criteria.get("conditional_yes")
+    return isinstance(conditional, dict) and all(
+        isinstance(keywords, list) for keywords in conditional.values()
+    )
+
+
+def _compact_criteria(criteria: Dict) -> Dict:
+    """Diff criteria against the defaults for storage; pass through unchanged
+    when the shape isn't the one the editor produces."""
+    defaults = default_preferred_criteria()
+    try:
+        if not _is_criteria_full(criteria):
+            raise TypeError("criteria buckets are not keyword lists")
+        compacted = {
+            "format": _CRITERIA_DELTA_FORMAT,
+            "strong_yes": _diff_keywords(criteria["strong_yes"], defaults["strong_yes"]),
+            "conditional_yes": {
+                group: _diff_keywords(keywords, defaults["conditional_yes"].get(group, []))
+                for group, keywords in criteria["conditional_yes"].items()
+            },
+            "strong_no": _diff_keywords(criteria["strong_no"], defaults["strong_no"]),
+        }
+        # Keys we don't recognize (imports may carry extra buckets) ride
+        # along verbatim; _expand_criteria hands them back unchanged.
+        for key, value in criteria.items():
+            if key not in compacted:
+                compacted[key] = value
+        return compacted
+    except (KeyError, TypeError):
+        # Never persist the reserved format marker on a dict we didn't
+        # compact ourselves — the loader would misread it as a delta.
+        if "format" in criteria:
+            return {k: v for k, v in criteria.items() if k != "format"}
+        return criteria
+
+
+def _is_criteria_delta(criteria: Dict) -> bool:
+    """True when every bucket has the {added, removed} shape _compact_criteria
+    writes — not merely the format tag, which untrusted input can carry."""
+    if criteria.get("format") != _CRITERIA_DELTA_FORMAT:
+        return False
+    if not all(isinstance(criteria.get(bucket, {}), dict) for bucket in ("strong_yes", "strong_no")):
+        return False
+    conditional = criteria.get("conditional_yes")
+    if conditional is None:
+        return True
+    return isinstance(conditional, dict) and all(
+        isinstance(delta, dict) for delta in conditional.values()
+    )
+
+
+def _expand_criteria(criteria) -> Dict:
+    """Rebuild full keyword lists from a stored delta (or legacy full form)."""
+    if not isinstance(criteria, dict):
+        return criteria
+    if not _is_criteria_delta(criteria):
+        # Legacy full-form criteria (or a foreign dict that only looks like a
+        # delta): intern in place so repeated contexts still share keyword
+        # strings, but otherwise pass through untouched.
+        expanded = dict(criteria)
+        for bucket in ("strong_yes", "strong_no"):
+            if isinstance(expanded.get(bucket), list):
+                expanded[bucket] = _intern_list(expanded[bucket])
+        if isinstance(expanded.get("conditional_yes"), dict):
+            expanded["conditional_yes"] = {
+                group: _intern_list(kws) if isinstance(kws, list) else kws
+                for group, kws in expanded["conditional_yes"].items()
+            }
+        return expanded
+    defaults = default_preferred_criteria()
+    # Unrecognized keys were stored verbatim alongside the delta; restore
+    # them first, minus the reserved format marker.
+    expanded = {k: v for k, v in criteria.items() if k not in ("format", "strong_yes", "conditional_yes", "strong_no")}
+    expanded.update(
+        strong_yes=_apply_keywords(criteria.get("strong_yes", {}), defaults["strong_yes"]),
+        conditional_yes={
+            group: _apply_keywords(delta, defaults["conditional_yes"].get(group, []))
+            for group, delta in (criteria.get("conditional_yes") or {}).items()
+        },
+        strong_no=_apply_keywords(criteria.get("strong_no", {}), defaults["strong_no"]),
+    )
+    return expanded
+
+
+def _valid_import(context_data) -> bool:
+    """Cheap schema check for imported contexts: a dict whose known fields
+    have the types the editor produces. Unknown keys are allowed through."""
+    if not isinstance(context_data, dict):
+        return False
+    for key in ("company_name", "company_context", "created", "last_updated"):
+        if key in context_data and not isinstance(context_data[key], str):
+            return False
+    criteria = context_data.get("preferred_grant_criteria")
+    if criteria is not None:
+        if not isinstance(criteria, dict):
+            return False
+        # "format" is reserved for the on-disk delta encoding — imported
+        # criteria must always be the full form.
+        if "format" in criteria:
+            return False
+        for bucket in ("strong_yes", "strong_no"):
+            if bucket in criteria and not isinstance(criteria[bucket], list):
+                return False
+        conditional = criteria.get("conditional_yes")
+        if conditional is not None:
+            if not isinstance(conditional, dict):
+                return False
+            if not all(isinstance(kws, list) for kws in conditional.values()):
+                return False
+    return True
+
+
+def _hash_key(text: str) -> str:
+    """Hash a workspace key or context name into a filename tag.
+
+    xxh64 is an order of magnitude cheaper than sha256 and plenty here —
+    this is not a security boundary.
+    """
+    if xxhash is None:
+        return hashlib.sha256(text.encode()).hexdigest()[:16]
+    return xxhash.xxh64_hexdigest(text.encode())
+
+
+# Each workspace is a directory: contexts_<hash>/index.jsonl is an append-only
+# log ({name, file, last_updated} per save, {name, deleted} tombstones per
+# delete) and each context lives in its own <name-hash>.json file. Saving one
+# context therefore writes O(1) bytes instead of rewriting every context in
+# the workspace.
+_INDEX_NAME = "index.jsonl"
+
+
+@functools.lru_cache(maxsize=32)
+def _workspace_dir(base_storage_dir: str, workspace_key: str) -> str:
+    """Resolve (and memoize) the workspace directory, migrating old layouts."""
+    dir_path = os.path.join(base_storage_dir, f"contexts_{_hash_key(workspace_key)}")
+    if not os.path.isdir(dir_path):
+        # A workspace created while running on the sha256 fallback lives in a
+        # sha256-named directory; once xxhash is installed the xxh64 name
+        # resolves elsewhere and the data would silently vanish. Rename the
+        # old directory over, mirroring the legacy-blob handling.
+        if xxhash is not None:
+            sha_hash = hashlib.sha256(workspace_key.encode()).hexdigest()[:16]
+            legacy_dir = os.path.join(base_storage_dir, f"contexts_{sha_hash}")
+            if os.path.isdir(legacy_dir):
+                os.rename(legacy_dir, dir_path)
+                return dir_path
+        _migrate_legacy_blob(base_storage_dir, workspace_key, dir_path)
+    return dir_path
+
+
+def _migrate_legacy_blob(base_storage_dir: str, workspace_key: str, dir_path: str) -> None:
+    """Split a single-blob contexts_<hash>.json file into the per-context
+    layout, checking both the xxh64 and the older sha256 naming schemes."""
+    candidates = [f"contexts_{_hash_key(workspace_key)}.json"]
+    if xxhash is not None:
+        sha_hash = hashlib.sha256(workspace_key.encode()).hexdigest()[:16]
+        candidates.append(f"contexts_{sha_hash}.json")
+    for blob_name in candidates:
+        blob_path = os.path.join(base_storage_dir, blob_name)
+        try:
+            with open(blob_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            continue
+        try:
+            contexts = _loads(data) if data and data != b"{}" else {}
+        except ValueError:
+            continue
+        os.makedirs(dir_path, exist_ok=True)
+        index_lines = []
+        for name, context in contexts.items():
+            # Legacy blobs hold full-form criteria (never deltas); full form
+            # is itself a valid on-disk form — the loader detects it by the
+            # missing format tag — so write entries through verbatim rather
+            # than compacting here.
+            file_name = f"{_hash_key(name)}.json"
+            with open(os.path.join(dir_path, file_name), "wb") as f:
+                f.write(_dumps_compact(context))
+            record = {"name": name, "file": file_name}
+            if isinstance(context, dict) and context.get("last_updated"):
+                record["last_updated"] = context["last_updated"]
+            index_lines.append(_dumps_compact(record) + b"\n")
+        with open(os.path.join(dir_path, _INDEX_NAME), "wb") as f:
+            f.write(b"".join(index_lines))
+        # Keep the blob around as a safety net, but out of the lookup path.
+        os.replace(blob_path, blob_path + ".migrated")
+        return
+
+
 class ContextManager:
     def __init__(self):
         self.base_storage_dir = "user_contexts"
+        # Parsed-file cache: file_path -> (st_mtime_ns, st_size, contexts,
+        # name -> file map folded from the index).
+        # Streamlit reruns the whole script on every widget interaction, so
+        # serving unchanged files from memory avoids re-parsing the same JSON
+        # several times per click.
+        self._cache: Dict[str, tuple] = {}
+        # Workspaces known (from a save) to hold no contexts — lets loads for
+        # brand-new users return without touching the disk at all.
+        self._empty_workspaces: set = set()
         self.ensure_storage_dir()
 
     def ensure_storage_dir(self) -> None:
-        if not os.path.exists(self.base_storage_dir):
-            os.makedirs(self.base_storage_dir)
+        os.makedirs(self.base_storage_dir, exist_ok=True)
+
+    def get_user_dir(self, workspace_key: str) -> str:
+        return _workspace_dir(self.base_storage_dir, workspace_key)
 
     def get_user_file_path(self, workspace_key: str) -> str:
-        key_hash = hashlib.sha256(workspace_key.encode()).hexdigest()[:16]
-        return os.path.join(self.base_storage_dir, f"contexts_{key_hash}.json")
+        """Path of the workspace index file; its mtime tracks every change."""
+        return os.path.join(self.get_user_dir(workspace_key), _INDEX_NAME)
 
-    def load_contexts(self, workspace_key: str) -> Dict[str, Dict]:
-        if not workspace_key:
+    def _load_shared(self, workspace_key: str) -> Dict[str, Dict]:
+        """Load the workspace dict shared with the cache — never mutate it."""
+        if not workspace_key or workspace_key in self._empty_workspaces:
             return {}
         try:
-            file_path = self.get_user_file_path(workspace_key)
-            if os.path.exists(file_path):
-                with open(file_path, "r") as f:
-                    return json.load(f)
-            return {}
-        except (FileNotFoundError, json.JSONDecodeError):
+            index_path = self.get_user_file_path(workspace_key)
+            try:
+                stat = os.stat(index_path)
+            except FileNotFoundError:
+                return {}
+            cached = self._cache.get(index_path)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return cached[2]
+            with open(index_path, "rb") as f:
+                data = f.read()
+            # Freshly created workspaces are empty — skip the parser entirely.
+            if not data:
+                return {}
+            # Fold the log: later records win, tombstones drop names.
+            live: Dict[str, str] = {}
+            record_count = 0
+            for line in data.splitlines():
+                if not line.strip():
+                    continue
+                record_count += 1
+                try:
+                    record = _loads(line)
+                except ValueError:
+                    continue
+                # A damaged index degrades to skipping the bad records, same
+                # contract as the old loader's corrupt-file -> {} behavior.
+                if not isinstance(record, dict):
+                    continue
+                name = record.get("name")
+                if name is None:
+                    continue
+                if record.get("deleted"):
+                    live.pop(name, None)
+                elif record.get("file") is not None:
+                    live[name] = record["file"]
+            workspace_dir = os.path.dirname(index_path)
+            contexts: Dict[str, Dict] = {}
+            for name, file_name in live.items():
+                try:
+                    with open(os.path.join(workspace_dir, file_name), "rb") as f:
+                        context = _loads(f.read())
+                except (FileNotFoundError, ValueError):
+                    continue
+                if isinstance(context, dict) and "preferred_grant_criteria" in context:
+                    context["preferred_grant_criteria"] = _expand_criteria(
+                        context["preferred_grant_criteria"]
+                    )
+                contexts[name] = context
+            # Compact once redundant lines dominate the log, then re-stat so
+            # the cache entry matches the rewritten index. Compaction is only
+            # an optimization: if the write fails (read-only or full
+            # filesystem), loading must still succeed.
+            if record_count > max(16, 4 * len(live)):
+                try:
+                    self._rewrite_index(index_path, contexts, live)
+                    stat = os.stat(index_path)
+                except OSError:
+                    pass
+            self._cache[index_path] = (stat.st_mtime_ns, stat.st_size, contexts, live)
+            return contexts
+        except (FileNotFoundError, ValueError):
             return {}
 
+    def load_contexts(self, workspace_key: str) -> Dict[str, Dict]:
+        return copy.deepcopy(self._load_shared(workspace_key))
+
+    def load_contexts_cached(self, workspace_key: str) -> Dict[str, Dict]:
+        """Read-only view of the workspace contexts.
+
+        Callers must not mutate the result; use load_contexts for a private
+        copy. This keeps name lookups and single-context reads from deep
+        copying every context on every rerun.
+        """
+        return self._load_shared(workspace_key)
+
+    @staticmethod
+    def _atomic_write(path: str, payload: bytes) -> None:
+        # Write to a sibling temp file and rename over the target so a crash
+        # mid-write can never leave a truncated file behind. Encoding once and
+        # writing in a single call also beats streaming many tiny writes
+        # through the file object.
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _write_context_file(workspace_dir: str, file_name: str, context: Dict) -> None:
+        # Serialize criteria as deltas against the defaults; the in-memory
+        # dicts (and the cache entries) keep the full form.
+        if isinstance(context, dict) and isinstance(context.get("preferred_grant_criteria"), dict):
+            context = {**context, "preferred_grant_criteria": _compact_criteria(context["preferred_grant_criteria"])}
+        # Stored files are keyed by opaque hashes and never read by humans, so
+        # skip the ~30-50% size overhead of indentation; export_context is the
+        # only path that pretty-prints.
+        ContextManager._atomic_write(os.path.join(workspace_dir, file_name), _dumps_compact(context))
+
+    @staticmethod
+    def _index_record(name: str, file_name: str, context: Dict) -> Dict:
+        record = {"name": name, "file": file_name}
+        if isinstance(context, dict) and context.get("last_updated"):
+            record["last_updated"] = context["last_updated"]
+        return record
+
+    def _rewrite_index(self, index_path: str, contexts: Dict[str, Dict], files: Optional[Dict[str, str]] = None) -> None:
+        """Compact the log to one line per live context.
+
+        ``files`` is the name -> file map folded from the index; existing
+        entries must keep their recorded file names, which can predate a
+        hash-scheme change — re-deriving them would orphan the data files.
+        """
+        files = files or {}
+        lines = [
+            _dumps_compact(self._index_record(name, files.get(name, f"{_hash_key(name)}.json"), context)) + b"\n"
+            for name, context in contexts.items()
+        ]
+        self._atomic_write(index_path, b"".join(lines))
+
+    def _append_index(self, workspace_key: str, record: Dict) -> None:
+        index_path = self.get_user_file_path(workspace_key)
+        with open(index_path, "ab") as f:
+            f.write(_dumps_compact(record) + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _live_files(self, workspace_key: str) -> Dict[str, str]:
+        """Name -> file map folded from the index, loading it if needed."""
+        self._load_shared(workspace_key)
+        cached = self._cache.get(self.get_user_file_path(workspace_key))
+        return cached[3] if cached else {}
+
+    def _record_cache(self, workspace_key: str, contexts: Dict[str, Dict], files: Dict[str, str]) -> None:
+        """Refresh the in-memory cache so the next load skips the disk."""
+        if contexts:
+            self._empty_workspaces.discard(workspace_key)
+        else:
+            self._empty_workspaces.add(workspace_key)
+        index_path = self.get_user_file_path(workspace_key)
+        try:
+            stat = os.stat(index_path)
+        except FileNotFoundError:
+            return
+        self._cache[index_path] = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(contexts), dict(files))
+
     def save_contexts(self, contexts: Dict[str, Dict], workspace_key: str) -> None:
+        """Rewrite the whole workspace. Bulk path — single saves are O(1)
+        through save_context."""
         if not workspace_key:
             return
-        file_path = self.get_user_file_path(workspace_key)
-        with open(file_path, "w") as f:
-            json.dump(contexts, f, indent=2)
+        workspace_dir = self.get_user_dir(workspace_key)
+        os.makedirs(workspace_dir, exist_ok=True)
+        files = {name: f"{_hash_key(name)}.json" for name in contexts}
+        for name, context in contexts.items():
+            self._write_context_file(workspace_dir, files[name], context)
+        self._rewrite_index(os.path.join(workspace_dir, _INDEX_NAME), contexts, files)
+        self._record_cache(workspace_key, contexts, files)
 
     def get_context_names(self, workspace_key: str) -> List[str]:
-        return list(self.load_contexts(workspace_key).keys())
+        return list(self.load_contexts_cached(workspace_key).keys())
 
     def get_context(self, name: str, workspace_key: str) -> Optional[Dict]:
-        return self.load_contexts(workspace_key).get(name)
+        context = self.load_contexts_cached(workspace_key).get(name)
+        # Copy just the requested context so callers can mutate it freely.
+        return copy.deepcopy(context) if context is not None else None
 
     def save_context(self, name: str, context_data: Dict, workspace_key: str) -> None:
         if not workspace_key:
             return
-        contexts = self.load_contexts(workspace_key)
         context_data["last_updated"] = datetime.now().isoformat()
-        contexts[name] = context_data
-        self.save_contexts(contexts, workspace_key)
+        contexts = {**self._load_shared(workspace_key), name: context_data}
+        workspace_dir = self.get_user_dir(workspace_key)
+        os.makedirs(workspace_dir, exist_ok=True)
+        # Keep whatever file name the index already records for this context
+        # so updates land on the existing file even after a hash-scheme change.
+        files = dict(self._live_files(workspace_key))
+        file_name = files.setdefault(name, f"{_hash_key(name)}.json")
+        self._write_context_file(workspace_dir, file_name, context_data)
+        self._append_index(workspace_key, self._index_record(name, file_name, context_data))
+        self._record_cache(workspace_key, contexts, files)
 
     def delete_context(self, name: str, workspace_key: str) -> None:
         if not workspace_key:
             return
-        contexts = self.load_contexts(workspace_key)
-        if name in contexts:
-            del contexts[name]
-            self.save_contexts(contexts, workspace_key)
+        contexts = self._load_shared(workspace_key)
+        if name not in contexts:
+            return
+        remaining = {k: v for k, v in contexts.items() if k != name}
+        files = dict(self._live_files(workspace_key))
+        file_name = files.pop(name, f"{_hash_key(name)}.json")
+        self._append_index(workspace_key, {"name": name, "deleted": True})
+        try:
+            os.remove(os.path.join(self.get_user_dir(workspace_key), file_name))
+        except FileNotFoundError:
+            pass
+        self._record_cache(workspace_key, remaining, files)
 
     def export_context(self, name: str, workspace_key: str) -> Optional[str]:
         context = self.get_context(name, workspace_key)
         if context:
-            return json.dumps(context, indent=2)
+            return _dumps(context).decode("utf-8")
         return None
 
+    # Upper bound on pasted import payloads — a real exported context is a
+    # few KB, so anything near this is garbage or abuse.
+    MAX_IMPORT_BYTES = 1_000_000
+
     def import_context(self, json_string: str, workspace_key: str, context_name: Optional[str] = None) -> bool:
         if not workspace_key:
             return False
+        if not json_string or len(json_string) > self.MAX_IMPORT_BYTES:
+            return False
         try:
-            context_data = json.loads(json_string)
-            if not context_name:
-                context_name = context_data.get("company_name", "Imported Context")
-            self.save_context(context_name, context_data, workspace_key)
-            return True
-        except json.JSONDecodeError:
+            context_data = _loads(json_string)
+        except ValueError:
+            return False
+        if not _valid_import(context_data):
             return False
+        if not context_name:
+            context_name = context_data.get("company_name", "Imported Context")
+        self.save_context(context_name, context_data, workspace_key)
+        return True
+
+
+_manager_factory = None
+
+
+def get_context_manager() -> ContextManager:
+    """Process-wide ContextManager cached across Streamlit reruns.
+
+    Constructing a fresh manager per rerun threw away the parsed-file cache
+    and re-ran the storage-dir check every time; st.cache_resource keeps one
+    instance alive so the cache keeps accumulating value."""
+    global _manager_factory
+    if _manager_factory is None:
+        import streamlit as st
+
+        @st.cache_resource(show_spinner=False)
+        def _build() -> ContextManager:
+            return ContextManager()
+
+        _manager_factory = _build
+    return _manager_factory()
+
+
+_cached_context_names = None
+
+
+def _get_cached_context_names():
+    """Build the st.cache_data-wrapped name lookup on first use.
+
+    Deferred so importing this module for the file API alone doesn't pull in
+    streamlit.
+    """
+    global _cached_context_names
+    if _cached_context_names is None:
+        import streamlit as st
+
+        @st.cache_data(ttl=60, show_spinner=False)
+        def _context_names(workspace_key: str, file_mtime_ns: int) -> List[str]:
+            # file_mtime_ns is part of the cache key so entries invalidate
+            # exactly when the context file changes on disk.
+            return get_context_manager().get_context_names(workspace_key)
+
+        _cached_context_names = _context_names
+    return _cached_context_names
 
 
 def get_workspace_key() -> str:
+    import streamlit as st
+
     if "workspace_key" not in st.session_state:
         st.session_state.workspace_key = ""
 
@@ -141,15 +641,44 @@ def create_default_context() -> Dict:
     return {
         "company_name": "",
         "company_context": "",
-        "preferred_grant_criteria": copy.deepcopy(DEFAULT_PREFERRED_CRITERIA),
+        "preferred_grant_criteria": default_preferred_criteria(),
         "created": now,
         "last_updated": now,
     }
 
 
+def _confirm_delete_dialog(context_manager: ContextManager, name: str, workspace_key: str) -> None:
+    """Ask for delete confirmation in a dialog instead of nested buttons.
+
+    The old button tree needed a rerun (and a full context reload) per click
+    just to reveal the confirm step; the dialog handles the whole exchange in
+    one render pass and reruns once, after the delete."""
+    import streamlit as st
+
+    @st.dialog("Confirm delete")
+    def _confirm():
+        st.warning(f"Delete '{name}'? This cannot be undone.")
+        col_yes, col_no = st.columns(2)
+        with col_yes:
+            if st.button("✅ Yes, Delete", key="dialog_confirm_yes", use_container_width=True):
+                context_manager.delete_context(name, workspace_key)
+                st.rerun()
+        with col_no:
+            if st.button("❌ Cancel", key="dialog_confirm_no", use_container_width=True):
+                st.rerun()
+
+    _confirm()
+
+
 def render_context_selector(context_manager: ContextManager):
+    import streamlit as st
+
     workspace_key = st.session_state.workspace_key
-    context_names = context_manager.get_context_names(workspace_key)
+    try:
+        mtime_ns = os.stat(context_manager.get_user_file_path(workspace_key)).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    context_names = _get_cached_context_names()(workspace_key, mtime_ns)
 
     st.subheader("🏢 Company Context Management")
     if not context_names:
@@ -171,34 +700,23 @@ def render_context_selector(context_manager: ContextManager):
                 st.session_state.editing_context = True
         with col3:
             if selected and st.button("🗑️ Delete", key="quick_delete"):
-                if not st.session_state.get("confirm_delete", False):
-                    st.session_state.confirm_delete = True
-                    st.warning(f"Delete '{selected}'? This cannot be undone.")
-                    col_yes, col_no = st.columns(2)
-                    with col_yes:
-                        if st.button("✅ Yes, Delete", key="confirm_yes"):
-                            context_manager.delete_context(selected, workspace_key)
-                            st.session_state.confirm_delete = False
-                            st.success("Deleted!")
-                            st.rerun()
-                    with col_no:
-                        if st.button("❌ Cancel", key="confirm_no"):
-                            st.session_state.confirm_delete = False
-                            st.rerun()
-                else:
-                    st.session_state.confirm_delete = False
+                _confirm_delete_dialog(context_manager, selected, workspace_key)
 
     return selected
 
 
 def render_context_editor(context_manager: ContextManager, context_name: Optional[str] = None):
+    import streamlit as st
+
     workspace_key = st.session_state.workspace_key
 
     if context_name:
-        context_data = context_manager.get_context(context_name, workspace_key) or create_default_context()
+        stored_context = context_manager.get_context(context_name, workspace_key)
+        context_data = stored_context or create_default_context()
         if not context_data.get("company_name"):
             context_data["company_name"] = context_name
     else:
+        stored_context = None
         context_data = create_default_context()
 
     creating_new = st.session_state.get("creating_new_context", False)
@@ -222,12 +740,25 @@ def render_context_editor(context_manager: ContextManager, context_name: Optiona
         # Preferred grant criteria editor
         st.write("---")
         st.markdown("**🎯 Preferred Grant Criteria (affects suitability guidance)**")
-        crit = context_data.get("preferred_grant_criteria") or copy.deepcopy(DEFAULT_PREFERRED_CRITERIA)
-        strong_yes_str = ", ".join(crit.get("strong_yes", []))
-        strong_no_str = ", ".join(crit.get("strong_no", []))
-        cond_yes = crit.get("conditional_yes", {})
-        tech_sys_str = ", ".join(cond_yes.get("technical_systems", []))
-        socio_str = ", ".join(cond_yes.get("sociotech_modeling", []))
+        # Join the keyword lists once per context and keep the strings in
+        # session state — reruns happen on every keystroke and the re-join
+        # (and re-split on save) is wasted work for long criteria lists.
+        csv_key = context_name or "<new>"
+        if st.session_state.get("_criteria_csv_key") != csv_key:
+            crit = context_data.get("preferred_grant_criteria") or default_preferred_criteria()
+            cond_yes = crit.get("conditional_yes", {})
+            st.session_state["_criteria_csv_key"] = csv_key
+            st.session_state["_criteria_csv"] = {
+                "strong_yes": ", ".join(crit.get("strong_yes", [])),
+                "strong_no": ", ".join(crit.get("strong_no", [])),
+                "technical_systems": ", ".join(cond_yes.get("technical_systems", [])),
+                "sociotech_modeling": ", ".join(cond_yes.get("sociotech_modeling", [])),
+            }
+        csv_cache = st.session_state["_criteria_csv"]
+        strong_yes_str = csv_cache["strong_yes"]
+        strong_no_str = csv_cache["strong_no"]
+        tech_sys_str = csv_cache["technical_systems"]
+        socio_str = csv_cache["sociotech_modeling"]
 
         col_sy, col_sn = st.columns(2)
         with col_sy:
@@ -302,30 +833,15 @@ def render_context_editor(context_manager: ContextManager, context_name: Optiona
         with col3:
             if not creating_new and context_name:
                 if st.button("🗑️ Delete", key="editor_delete"):
-                    if not st.session_state.get("confirm_editor_delete", False):
-                        st.session_state.confirm_editor_delete = True
-                        st.warning(f"Delete '{context_name}'? This cannot be undone.")
-                        col_yes, col_no = st.columns(2)
-                        with col_yes:
-                            if st.button("✅ Yes, Delete", key="editor_confirm_yes"):
-                                context_manager.delete_context(context_name, workspace_key)
-                                st.session_state.confirm_editor_delete = False
-                                st.success("Deleted!")
-                                st.rerun()
-                        with col_no:
-                            if st.button("❌ Cancel", key="editor_confirm_no"):
-                                st.session_state.confirm_editor_delete = False
-                                st.rerun()
-                    else:
-                        st.session_state.confirm_editor_delete = False
+                    _confirm_delete_dialog(context_manager, context_name, workspace_key)
 
         if creating_new:
             if st.button("❌ Cancel"):
                 st.session_state.creating_new_context = False
                 st.rerun()
 
-    if context_name:
-        return context_manager.get_context(context_name, workspace_key)
-    return None
+    # Return the context loaded at the top of the render — a save always
+    # triggers st.rerun(), so re-fetching here was a pure duplicate read.
+    return stored_context
 
 